@@ -28,7 +28,6 @@ Example::
 
 from typing import TYPE_CHECKING
 
-from os import path
 from pathlib import Path
 
 from docutils import nodes
@@ -38,22 +37,31 @@ from sphinx.util.docutils import SphinxDirective
 from sphinx.util.osutil import copyfile, ensuredir
 
 if TYPE_CHECKING:
-    from typing import List
+    from typing import List, Optional
     from sphinx.application import Sphinx
 
-from .transforms import MCQChoices, MCQFeedback
+from .transforms import MCQChoices, find_choices_lists
 from .addnodes import mcq, mcq_body
 from . import addnodes, builder
 
 logger = logging.getLogger(__name__)
 
-module_dir = Path(path.abspath(path.dirname(__file__)))
-assets_dir = (module_dir / "assets").resolve()
+assets_dir = Path(__file__).resolve().parent / "assets"
 css_files = [
     ("mcq-styles.css", {}),
 ]
 
 
+def _flag(argument: "Optional[str]") -> bool:
+    """Like directives.flag, but the option's value is True when it's present.
+
+    Flag options that weren't given are simply left out of self.options.
+    """
+
+    directives.flag(argument)
+    return True
+
+
 class MCQDirective(SphinxDirective):
     has_content = True
     required_arguments = 1
@@ -63,8 +71,8 @@ class MCQDirective(SphinxDirective):
         "answer": directives.unchanged,
         "class": directives.class_option,
         "name": directives.unchanged,
-        "numbered": directives.flag,
-        "show_feedback": directives.flag,
+        "numbered": _flag,
+        "show_feedback": _flag,
     }
 
     def __init__(self, *args, **kwargs):
@@ -74,20 +82,17 @@ class MCQDirective(SphinxDirective):
             self.env._mcq_count = 0
         self.env._mcq_count += 1
 
-        # Create name if it doesn't exist
-        if not self.options.get("name"):
-            self.options["name"] = f"mcq-{self.env._mcq_count}"
+        opts = self.options
 
-        # Parse flags in self.options to True/False
-        for opt_name, opt_type in self.option_spec.items():
-            if opt_type is directives.flag:
-                self.options[opt_name] = opt_name in self.options
+        # Create name if it doesn't exist
+        if not opts.get("name"):
+            opts["name"] = f"mcq-{self.env._mcq_count}"
 
         # 'numbered' and 'show_feedback' options should become classes
-        classes = self.options.setdefault("classes", [])
-        if self.options.get("numbered"):
+        classes = opts.setdefault("classes", [])
+        if opts.get("numbered", False):
             classes.append("numbered")
-        if self.options.get("show_feedback"):
+        if opts.get("show_feedback", False):
             classes.append("show-feedback")
 
     def run(self) -> "List[mcq]":
@@ -103,14 +108,20 @@ class MCQDirective(SphinxDirective):
             - mcq_feedback
         """
 
-        node = mcq("\n".join(self.content), **self.options)
+        # Let MCQChoices skip documents without mcq directives. This is a plain
+        # Python attribute, so it stays out of the docutils attributes and the
+        # xml/pseudoxml output (it is still pickled with the doctree).
+        self.state.document._has_mcq = True
+
+        rawsource = "\n".join(self.content)
+        node = mcq(rawsource, **self.options)
         self.add_name(node)
 
         # First argument becomes the prompt
         textnodes, _ = self.state.inline_text(self.arguments[0], self.lineno)
         question_prompt = nodes.paragraph(self.arguments[0], "", *textnodes)
 
-        body = mcq_body("\n".join(self.content))
+        body = mcq_body(rawsource)
         self.state.nested_parse(self.content, self.content_offset, body)
 
         # Rearrange body.children so it starts with first_paragraph followed
@@ -118,6 +129,10 @@ class MCQDirective(SphinxDirective):
         body.children = [question_prompt, *body.children]
         node += body
 
+        # Remember where the answer choices are so MCQChoices doesn't have to
+        # search the whole question again.
+        node.choices_lists = find_choices_lists(body)
+
         return [node]
 
 
@@ -138,12 +153,10 @@ def copy_css_files(app: "Sphinx", exception: Exception) -> None:
         return
 
     staticdir = (Path(app.builder.outdir) / "_static").resolve()
-    for f in [file for file, *_ in css_files]:
+    ensuredir(str(staticdir))
+    for f, *_ in css_files:
         try:
-            source = assets_dir / f
-            dest = staticdir / Path(f).name
-            ensuredir(str(dest.parent))
-            copyfile(str(source), str(dest))
+            copyfile(str(assets_dir / f), str(staticdir / Path(f).name))
         except FileNotFoundError:
             logger.warning(f"Could not copy {f} to output directory.", color="yellow")
 
@@ -155,5 +168,4 @@ def setup(app: "Sphinx"):
     addnodes.setup(app)
     app.add_directive("mcq", MCQDirective)
     app.add_transform(MCQChoices)
-    app.add_transform(MCQFeedback)
     builder.setup(app)
@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING
 from docutils import nodes
 
 if TYPE_CHECKING:
-    from typing import Optional
+    from typing import List, Optional
     from sphinx.application import Sphinx
 
 
@@ -25,6 +25,10 @@ class mcq(UsesNameAsClass, nodes.Element):
 
     classname = "mcq"
 
+    #: Answer choice lists found by MCQDirective, used once by MCQChoices.
+    #: This isn't a docutils attribute, so copies of the node don't keep it.
+    choices_lists: "Optional[List[nodes.enumerated_list]]" = None
+
 
 class mcq_body(UsesNameAsClass, nodes.Element):
     """The prompt and body text of a multiple choice question."""
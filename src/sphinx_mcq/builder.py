@@ -96,8 +96,8 @@ class McqQuestion:
             text=question_body.astext(),
             html=builder.render_partial(question_body)["fragment"],
             answer=node.get("answer"),
-            show_feedback=node.get("show_feedback"),
-            numbered=node.get("numbered"),
+            show_feedback=node.get("show_feedback", False),
+            numbered=node.get("numbered", False),
         )
 
 
@@ -6,31 +6,116 @@ from sphinx.util.docfields import _is_single_paragraph
 from .addnodes import mcq, mcq_choices_list, mcq_choice, mcq_choice_feedback
 
 if TYPE_CHECKING:
-    from typing import Any
+    from typing import Any, List
+
+_CHOICE_LETTERS = tuple("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+_FEEDBACK = "feedback"
+
+
+def find_choices_lists(node: "nodes.Element") -> "List[nodes.enumerated_list]":
+    """Return upperalpha enumerated lists (the answer choices) under node."""
+
+    return [
+        enum_list
+        for enum_list in node.findall(nodes.enumerated_list, include_self=False)
+        if enum_list.get("enumtype") == "upperalpha"
+    ]
+
+
+def _has_feedback_name(field: "nodes.field") -> bool:
+    field_name = field.children[0]
+    if not isinstance(field_name, nodes.field_name):
+        return False
+
+    # Compare lengths first so most other field names are rejected before lower()
+    name = field_name.astext().strip()
+    return len(name) == len(_FEEDBACK) and name.lower() == _FEEDBACK
+
+
+def _paragraph(children: "List[nodes.Node]") -> nodes.paragraph:
+    """Wrap children in a paragraph without going through Element.extend."""
+
+    paragraph = nodes.paragraph()
+    paragraph.children = list(children)
+    for child in paragraph.children:
+        child.parent = paragraph
+    return paragraph
+
+
+def replace_feedback_fields(choice_node: mcq_choice) -> None:
+    """Replace feedback field lists in choice_node with mcq_choice_feedback.
+
+    Feedback fields are always written directly under the answer choice, so
+    only the field lists that are direct children of choice_node are checked.
+    """
+
+    for field_list in list(choice_node.children):
+        if not isinstance(field_list, nodes.field_list):
+            continue
+
+        for feedback_field in field_list.children:
+            if _has_feedback_name(feedback_field):
+                break
+        else:
+            continue
+
+        _, field_body = feedback_field.children
+        body_children = field_body.children
+
+        # Feedback is almost always one paragraph, so check for that before
+        # falling back to _is_single_paragraph (which allows system messages)
+        if (
+            len(body_children) == 1 and isinstance(body_children[0], nodes.paragraph)
+        ) or _is_single_paragraph(field_body):
+            paragraph = cast(nodes.paragraph, body_children[0])
+            content = paragraph.children
+        else:
+            content = body_children
+
+        # Replace field list with mcq_choice_feedback node
+        field_list.replace_self(
+            mcq_choice_feedback(
+                "",
+                _paragraph(content),
+                is_correct=choice_node["mcq_is_correct"],
+            )
+        )
 
 
 class MCQChoices(SphinxTransform):
+    """Turn the answer choices of mcq nodes into mcq_choice nodes.
+
+    Only documents that used the mcq directive are transformed.
+    """
+
     default_priority = 200
-    choice_indexes = list("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
 
     def apply(self, **kwargs: "Any") -> None:
+        if not getattr(self.document, "_has_mcq", False):
+            return
+
         for mcq_node in self.document.findall(mcq, include_self=False):
-            for answer_choices in mcq_node.findall(
-                condition=lambda n: isinstance(n, nodes.enumerated_list)
-                and n.get("enumtype") == "upperalpha",
-                include_self=False,
-            ):
-                gen_choice_index = iter(self.choice_indexes)
+            mcq_id = mcq_node["ids"][0]
+
+            # MCQDirective caches the lists it parsed. Copies of its mcq nodes
+            # (and mcq nodes added by other code) don't have it, so search them.
+            choices_lists = getattr(mcq_node, "choices_lists", None)
+            mcq_node.choices_lists = None
+            if choices_lists is None:
+                choices_lists = find_choices_lists(mcq_node)
+
+            for answer_choices in choices_lists:
+                answer = mcq_node["answer"]
+
                 # Transform list_item node to mcq_choice node
-                for item in answer_choices.children:
-                    choice_node = mcq_choice("", *item.children)
-                    choice_node.update_all_atts(item)
-
-                    choice_node["mcq_id"] = mcq_node["ids"][0]
-                    choice_node["value"] = next(gen_choice_index)
-                    choice_node["mcq_is_correct"] = (
-                        choice_node["value"] == mcq_node["answer"]
-                    )
+                for idx, item in enumerate(answer_choices.children):
+                    value = _CHOICE_LETTERS[idx]
+                    attributes = dict(item.attributes)
+                    attributes["mcq_id"] = mcq_id
+                    attributes["value"] = value
+                    attributes["mcq_is_correct"] = value == answer
+                    choice_node = mcq_choice("", *item.children, **attributes)
+                    replace_feedback_fields(choice_node)
 
                     item.replace_self(choice_node)
                 answer_choices.replace_self(
@@ -38,43 +123,3 @@ class MCQChoices(SphinxTransform):
                         "", *answer_choices.children, classes=["upperalpha"]
                     )
                 )
-
-
-def is_feedback_field(node: "nodes.Node") -> bool:
-    def _has_feedback_field(node):
-        field_name, *_ = node.children
-        return (
-            isinstance(field_name, nodes.field_name)
-            and field_name.astext().strip().lower() == "feedback"
-        )
-
-    return isinstance(node, nodes.field) and _has_feedback_field(node)
-
-
-class MCQFeedback(SphinxTransform):
-    default_priority = 201
-
-    def apply(self, **kwargs: "Any") -> None:
-        for choice_node in self.document.findall(mcq_choice):
-            for feedback_field in choice_node.findall(is_feedback_field):
-                content = []
-                field_name, field_body = feedback_field.children
-
-                if (
-                    isinstance(field_name, nodes.field_name)
-                    and field_name.astext().strip().lower() == "feedback"
-                ):
-                    if _is_single_paragraph(field_body):
-                        paragraph = cast(nodes.paragraph, field_body[0])
-                        content = paragraph.children
-                    else:
-                        content = field_body.children
-
-                # Replace field list with mcq_choice_feedback node
-                feedback_field.parent.replace_self(
-                    mcq_choice_feedback(
-                        "",
-                        nodes.paragraph("", "", *content),
-                        is_correct=choice_node["mcq_is_correct"],
-                    )
-                )
@@ -1,42 +1,87 @@
 import pytest
-from bs4 import BeautifulSoup
-from sphinx.cmd.build import build_main
+import shutil
+import sphinx
 from pathlib import Path
+from sphinx.testing.util import SphinxTestApp
 
 pytest_plugins = "sphinx.testing.fixtures"
 collect_ignore = ["roots"]
 
+examples_dir = Path(__file__).parent / "examples"
+
 
 def pytest_configure(config):
     config.addinivalue_line("markers", "builder(name): mark test on specific builder")
 
 
+@pytest.fixture(scope="session")
+def sphinx_builds(tmp_path_factory):
+    """Build examples once per session and return their output directories.
+
+    Each example is copied to a temporary directory and built from scratch.
+    The app is cleaned up right after building, which restores the docutils
+    registries, so the next build doesn't warn about re-registered nodes.
+    """
+
+    outdirs = {}
+
+    def build(builder: str, build_dir: str) -> Path:
+        if (builder, build_dir) not in outdirs:
+            srcdir = tmp_path_factory.mktemp(build_dir) / build_dir
+            shutil.copytree(
+                examples_dir / build_dir,
+                srcdir,
+                ignore=shutil.ignore_patterns("_build"),
+            )
+
+            # SphinxTestApp only accepts pathlib paths from Sphinx 7.2 on
+            if sphinx.version_info < (7, 2):
+                from sphinx.testing.path import path
+
+                srcdir = path(str(srcdir))
+
+            app = SphinxTestApp(builder, srcdir=srcdir, freshenv=True)
+            try:
+                app.build()
+            finally:
+                app.cleanup()
+            outdirs[builder, build_dir] = Path(app.outdir)
+
+        return outdirs[builder, build_dir]
+
+    return build
+
+
 @pytest.fixture
-def build_contents(request):
+def sphinx_build_outdir(request, sphinx_builds):
+    """Output directory of the example named by the sphinx_build marker."""
+
     marker = request.node.get_closest_marker("sphinx_build")
 
     if marker is None:
         return None
     else:
-        builder = marker.args[0]
-        build_dir = marker.args[1]
-        example_dir = (Path(__file__).parent / "examples" / build_dir).resolve()
-        argv = [
-            "-b",
-            builder,
-            str(example_dir),
-            str(example_dir / "_build"),
-        ]
-
-        try:
-            build_main(argv)
-        except Exception as e:
-            raise e
+        return sphinx_builds(*marker.args)
+
+
+@pytest.fixture
+def build_contents(sphinx_build_outdir):
+    if sphinx_build_outdir is None:
+        return None
+    else:
+        # SphinxTestApp writes each builder's output to _build/<builder>
+        builder = sphinx_build_outdir.name
 
         if builder == "html":
-            with open(example_dir / "_build" / "index.html") as f:
+            with open(sphinx_build_outdir / "index.html") as f:
                 contents = f.read()
 
-            return BeautifulSoup(contents, "html.parser")
+            from bs4 import BeautifulSoup
+
+            try:
+                import lxml  # noqa: F401
+            except ImportError:
+                return BeautifulSoup(contents, "html.parser")
+            return BeautifulSoup(contents, "lxml")
         if builder == "json":
             return "hi"
@@ -1,3 +1,5 @@
+import json
+from pathlib import Path
 from typing import TYPE_CHECKING
 import pytest
 
@@ -11,6 +13,66 @@ def test_html_output(build_contents: "BeautifulSoup"):
     assert "Welcome to the Test Document" in build_contents.find("h1").text
 
 
+@pytest.mark.sphinx_build("html", "test_mcq")
+def test_html_feedback_is_removed(build_contents: "BeautifulSoup"):
+    assert build_contents.select("div.mcq dl.field-list") == []
+    assert "Reasons why" not in build_contents.get_text()
+
+
+@pytest.mark.sphinx_build("html", "test_mcq")
+def test_html_mcq_classes(build_contents: "BeautifulSoup"):
+    mcqs = build_contents.select("div.mcq")
+    assert [mcq["id"] for mcq in mcqs] == [
+        "mcq-1",
+        "mcq-2",
+        "mcq-3",
+        "feedback-question",
+    ]
+    assert [mcq["id"] for mcq in build_contents.select("div.mcq.numbered")] == [
+        "mcq-2",
+        "mcq-3",
+    ]
+    assert [mcq["id"] for mcq in build_contents.select("div.mcq.show-feedback")] == [
+        "feedback-question"
+    ]
+
+    checkers = build_contents.select("button.mcq-answer-checker")
+    assert len(checkers) == 1
+    assert checkers[0].parent["id"] == "feedback-question"
+    assert len(build_contents.select("p.mcq-alert")) == 1
+
+
+@pytest.mark.sphinx_build("html", "test_mcq")
+def test_answerkey_feedback(sphinx_build_outdir: Path):
+    with open(sphinx_build_outdir / "answerkey.json") as f:
+        answerkey = {question["id"]: question for question in json.load(f)}
+
+    question = answerkey["feedback-question"]
+    assert question["answer"] == "B"
+    assert question["show_feedback"] is True
+    assert question["numbered"] is False
+    assert [choice["text"] for choice in question["choices"]] == [
+        "This is a wrong answer.",
+        "This is the correct answer.",
+    ]
+    assert [choice["feedback"] for choice in question["choices"]] == [
+        {
+            "is_correct": False,
+            "text": "Reasons why this is a wrong answer.",
+            "html": "<p>Reasons why this is a wrong answer.</p>\n",
+        },
+        {
+            "is_correct": True,
+            "text": "Reasons why this is the correct answer.",
+            "html": "<p>Reasons why this is the correct answer.</p>\n",
+        },
+    ]
+
+    assert answerkey["mcq-1"]["numbered"] is False
+    assert answerkey["mcq-2"]["numbered"] is True
+    assert answerkey["mcq-2"]["show_feedback"] is False
+
+
 @pytest.mark.sphinx_build("json", "test_mcq")
 def test_json_output(build_contents):
     assert build_contents is not None